@@ -13,6 +13,7 @@ Reference:
     - https://github.com/librosa/librosa/blob/894942673d55aa2206df1296b6c4c50827c7f1d6/librosa/effects.py#L612
 """
 
+import math
 import warnings
 from collections.abc import Callable
 from typing import Any
@@ -135,7 +136,14 @@ def amplitude_to_db(
             stacklevel=2,
         )
 
-    magnitude = np.abs(S)
+    # Real input: squaring discards the sign already, so the absolute value is
+    # only taken when a reference function needs the magnitude and there is a
+    # sign to discard
+    real = S.dtype.kind == "f"
+    if real and not (callable(ref) and np.any(S < 0)):
+        magnitude = S
+    else:
+        magnitude = np.abs(S)
 
     if callable(ref):
         # User supplied a function to calculate reference power
@@ -143,13 +151,34 @@ def amplitude_to_db(
     else:
         ref_value = np.abs(ref)
 
-    out_array = magnitude if isinstance(magnitude, np.ndarray) else None
-    power = np.square(magnitude, out=out_array)
+    if real:
+        power = np.square(S)
+    else:
+        out_array = magnitude if isinstance(magnitude, np.ndarray) else None
+        power = np.square(magnitude, out=out_array)
+
+    if (
+        top_db is None
+        and isinstance(power, np.ndarray)
+        and amin > 0
+        and np.ndim(ref_value) == 0
+    ):
+        # `power` is our own buffer, so the conversion can run in place
+        return _power_to_db_fast(power, ref_value**2, amin**2)
 
     db: np.ndarray = power_to_db(power, ref=ref_value**2, amin=amin**2, top_db=top_db)
     return db
 
 
+# Silence floor used by `_signal_to_frame_nonsilent`: the power equivalent of
+# `amplitude_to_db(amin=1e-5)`
+_AMIN_POWER = 1e-10
+
+# Aggregates for which reducing several axes at once is the same as reducing
+# them one by one with `np.apply_over_axes`
+_AXES_REDUCTIONS = (np.max, np.amax, np.min, np.amin, np.mean, np.sum)
+
+
 def _signal_to_frame_nonsilent(
     y: np.ndarray,
     frame_length: int = 2048,
@@ -186,21 +215,58 @@ def _signal_to_frame_nonsilent(
     aggregate : callable [default: np.max]
         Function to aggregate dB measurements across channels (if y.ndim > 1)
 
-        Note: for multiple leading axes, this is performed using ``np.apply_over_axes``.
+        Note: for multiple leading axes, this is performed using ``np.apply_over_axes``,
+        or as a single reduction over all of them for ``np.max``, ``np.min``,
+        ``np.mean`` and ``np.sum``.
 
     Returns
     -------
     non_silent : np.ndarray, shape=(m,), dtype=bool
         Indicator of non-silent frames
     """
-    # Compute the MSE for the signal
-    mse = rms(y=y, frame_length=frame_length, hop_length=hop_length)
+    if ref is np.max and (y.ndim == 1 or aggregate is np.max):
+        # dB scaling is monotone, so thresholding at `top_db` below the peak is
+        # equivalent to comparing the frame power against the scaled peak power.
+        # This skips the sqrt in `rms` and both log passes in `amplitude_to_db`.
+        power = rms(y=y, frame_length=frame_length, hop_length=hop_length, _power=True)
+        power = power[..., 0, :]
+        if power.ndim > 1:
+            power = power.max(axis=tuple(range(power.ndim - 1)))
+
+        # Peak first in `max` so that NaN propagates, as with np.maximum
+        threshold = max(float(power.max()), _AMIN_POWER) * 10.0 ** (-top_db / 10.0)
+        if threshold < _AMIN_POWER:
+            # Every frame is at least `_AMIN_POWER`, hence above the threshold
+            return np.ones(power.shape, dtype=bool)
+        return power > threshold
+
+    # Compute the mean power for the signal and slice out the channel.
+    # This is ``amplitude_to_db(rms(y), ...)`` without the sqrt -> square
+    # round trip: ``power_to_db(S**2, ref=ref**2, amin=amin**2)``
+    power = rms(y=y, frame_length=frame_length, hop_length=hop_length, _power=True)
+    power = power[..., 0, :]
+
+    if ref is np.max or ref is np.min:
+        # Order statistics commute with the square root
+        ref_power = ref(power)
+    elif callable(ref):
+        ref_power = ref(np.sqrt(power)) ** 2
+    else:
+        ref_power = np.abs(ref) ** 2
 
-    # Convert to decibels and slice out the mse channel
-    db: np.ndarray = amplitude_to_db(mse[..., 0, :], ref=ref, top_db=None)
+    # Convert to decibels
+    db: np.ndarray
+    if np.ndim(ref_power) == 0:
+        db = _power_to_db_fast(power, ref_power, _AMIN_POWER)
+    else:
+        db = power_to_db(power, ref=ref_power, amin=_AMIN_POWER, top_db=None)
 
     # Aggregate everything but the time dimension
-    if db.ndim > 1:
+    if db.ndim > 1 and aggregate in _AXES_REDUCTIONS:
+        # Reducing the leading axes one at a time gives the same result for
+        # these, so do it in a single call
+        db = aggregate(db, axis=tuple(range(db.ndim - 1)))
+    elif db.ndim > 1:
         db = np.apply_over_axes(aggregate, db, range(db.ndim - 1))
         # Squeeze out leading singleton dimensions here
         # We always want to keep the trailing dimension though
@@ -277,16 +343,18 @@ def trim(
         aggregate=aggregate,
     )
 
-    nonzero = np.flatnonzero(non_silent)
+    # Only the first and last non-silent frames matter: argmax stops at the
+    # first True from either end instead of collecting every non-zero index
+    first = int(np.argmax(non_silent))
+
+    if non_silent[first]:
+        last = non_silent.size - 1 - int(np.argmax(non_silent[::-1]))
 
-    if nonzero.size > 0:
         # Compute the start and end positions
-        # End position goes one frame past the last non-zero
-        start = int(frames_to_samples(nonzero[0], hop_length=hop_length))
-        end = min(
-            y.shape[-1],
-            int(frames_to_samples(nonzero[-1] + 1, hop_length=hop_length)),
-        )
+        # End position goes one frame past the last non-zero.
+        # Plain integer math: this is `frames_to_samples` without array dispatch
+        start = first * hop_length
+        end = min(y.shape[-1], (last + 1) * hop_length)
     else:
         # The entire signal is trimmed here: nothing is above the threshold
         start, end = 0, 0
@@ -304,6 +372,7 @@ def rms(
     center: bool = True,
     pad_mode="constant",
     dtype=np.float32,
+    _power: bool = False,
 ) -> np.ndarray:
     """Compute root-mean-square (RMS) value for each frame, either from the
     audio samples ``y`` or from a spectrogram ``S``.
@@ -371,15 +440,46 @@ def rms(
 
     """
     if y is not None:
-        if center:
-            padding = [(0, 0) for _ in range(y.ndim)]
-            padding[-1] = (int(frame_length // 2), int(frame_length // 2))
-            y = np.pad(y, padding, mode=pad_mode)
-
-        x = frame(y, frame_length=frame_length, hop_length=hop_length)
-
-        # Calculate power
-        power = np.mean(abs2(x, dtype=dtype), axis=-2, keepdims=True)
+        if dtype is not None and np.isrealobj(y) and y.dtype != dtype:
+            # The power is computed in `dtype` regardless, so convert once up
+            # front: padding and framing then move `dtype`-sized samples, and
+            # e.g. float64 audio can use the float32 mono path below
+            y = y.astype(dtype)
+
+        pad = int(frame_length // 2) if center else 0
+        block = math.gcd(frame_length, hop_length)
+
+        if (
+            y.ndim == 1
+            and y.dtype == dtype
+            and np.isrealobj(y)
+            and (pad == 0 or pad_mode == "constant")
+            and hop_length >= 1
+            and block > 1
+            and pad % block == 0
+            and y.shape[-1] + 2 * pad >= frame_length
+        ):
+            # Mono real input: fuse square + sum into a single pass over `y`.
+            # Zero padding only contributes empty blocks, so `y` is not copied.
+            power = _frame_sum_squares(y, frame_length, hop_length, pad=pad)
+            power = power[np.newaxis, :]
+            power /= frame_length
+        else:
+            if center:
+                padding = [(0, 0) for _ in range(y.ndim)]
+                padding[-1] = (pad, pad)
+                y = np.pad(y, padding, mode=pad_mode)
+
+            x = frame(y, frame_length=frame_length, hop_length=hop_length)
+
+            # Calculate power
+            if x.ndim == 2 and x.dtype == dtype and np.isrealobj(x):
+                # Reduce the frame view directly, without materializing the
+                # squared frames
+                power = np.einsum("ij,ij->j", x, x)[np.newaxis, :]
+                power /= frame_length
+            else:
+                power = np.mean(abs2(x, dtype=dtype), axis=-2, keepdims=True)
     elif S is not None:
         # Check the frame length
         if S.shape[-2] != frame_length // 2 + 1:
@@ -402,10 +502,52 @@ def rms(
     else:
         raise ParameterError("Either `y` or `S` must be input.")
 
+    if _power:
+        # Mean power per frame, for callers that would square the RMS again
+        return power
+
     rms_result: np.ndarray = np.sqrt(power)
     return rms_result
 
 
+def _frame_sum_squares(
+    y: np.ndarray, frame_length: int, hop_length: int, pad: int = 0
+) -> np.ndarray:
+    """Sum of squares of each frame of a 1-D signal.
+
+    Frames and hops are both whole multiples of ``block = gcd(frame_length,
+    hop_length)`` samples.  The squares of each block are summed in a single
+    contiguous pass over ``y``, then the ``frame_length // block`` consecutive
+    block sums that make up each frame are added up.  Every sample is read
+    once instead of once per overlapping frame.
+
+    ``y`` is treated as if it were zero-padded by ``pad`` samples on both
+    sides, which must be a multiple of ``block``.  The padding only adds empty
+    block sums, so the signal itself is never copied.
+    """
+    block = math.gcd(frame_length, hop_length)
+    n_frames = 1 + (y.shape[-1] + 2 * pad - frame_length) // hop_length
+    n_blocks = ((n_frames - 1) * hop_length + frame_length) // block
+
+    block_sums = np.zeros(n_blocks, dtype=y.dtype)
+    lead = pad // block
+    n_full = min(y.shape[-1] // block, n_blocks - lead)
+
+    blocks = np.ascontiguousarray(y[: n_full * block]).reshape(n_full, block)
+    np.einsum("ij,ij->i", blocks, blocks, out=block_sums[lead : lead + n_full])
+
+    # Partial block at the end of the signal, completed by the right padding
+    if lead + n_full < n_blocks and n_full * block < y.shape[-1]:
+        tail = y[n_full * block : (n_full + 1) * block]
+        block_sums[lead + n_full] = np.dot(tail, tail)
+
+    if frame_length == hop_length:
+        return block_sums
+    return frame(
+        block_sums, frame_length=frame_length // block, hop_length=hop_length // block
+    ).sum(axis=0)
+
+
 def frame(
     x: np.ndarray,
     *,
@@ -547,6 +689,18 @@ def frame(
     if hop_length < 1:
         raise ParameterError(f"Invalid hop_length: {hop_length:d}")
 
+    if x.ndim == 1 and axis == -1:
+        # 1-D input: put the hop directly in the frame stride, instead of
+        # framing every sample then moving axes and downsampling
+        n_frames = 1 + (x.shape[0] - frame_length) // hop_length
+        return as_strided(
+            x,
+            shape=(frame_length, n_frames),
+            strides=(x.strides[0], hop_length * x.strides[0]),
+            subok=subok,
+            writeable=writeable,
+        )
+
     # put our new within-frame axis at the end for now
     out_strides = x.strides + tuple([x.strides[axis]])
 
@@ -688,14 +842,39 @@ def power_to_db(
     else:
         ref_value = np.abs(ref)
 
-    log_spec: np.ndarray = 10.0 * np.log10(np.maximum(amin, magnitude))
+    log_spec: np.ndarray = np.maximum(amin, magnitude)
+    if isinstance(log_spec, np.ndarray):
+        # Chain the remaining steps in place on the clamped copy, instead of
+        # allocating a new array for each of them
+        np.log10(log_spec, out=log_spec)
+        log_spec *= 10.0
+    else:
+        log_spec = 10.0 * np.log10(log_spec)
     log_spec -= 10.0 * np.log10(np.maximum(amin, ref_value))
 
     if top_db is not None:
         if top_db < 0:
             raise ParameterError("top_db must be non-negative")
-        log_spec = np.maximum(log_spec, log_spec.max() - top_db)
+        out = log_spec if isinstance(log_spec, np.ndarray) else None
+        log_spec = np.maximum(log_spec, log_spec.max() - top_db, out=out)
+
+    return log_spec
+
 
+def _power_to_db_fast(S: np.ndarray, ref_value: float, amin: float) -> np.ndarray:
+    """Specialization of `power_to_db` for a scalar ``ref`` and ``top_db=None``.
+
+    The reference offset is computed once as a Python scalar, and the
+    conversion is done in place on ``S`` when it is a floating point array,
+    so ``S`` must be a temporary owned by the caller.
+    """
+    out = S if S.dtype.kind == "f" else None
+    log_spec: np.ndarray = np.maximum(S, amin, out=out)
+    np.log10(log_spec, out=log_spec)
+    log_spec *= 10.0
+    # `abs` as in `power_to_db`, and the reference first in `max` so that NaN
+    # propagates, as with np.maximum
+    log_spec -= 10.0 * math.log10(max(abs(ref_value), amin))
     return log_spec
 
 